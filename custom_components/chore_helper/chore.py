@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import date, datetime, time, timedelta
+from logging import DEBUG
 from typing import Any
 from collections.abc import Generator
 from dateutil.relativedelta import relativedelta
@@ -32,6 +33,7 @@ class Chore(RestoreEntity):
         "_attr_name",
         "_attr_state",
         "_due_dates",
+        "_due_text_cache",
         "_date_format",
         "_days",
         "_first_month",
@@ -40,6 +42,7 @@ class Chore(RestoreEntity):
         "_icon_today",
         "_icon_tomorrow",
         "_icon_overdue",
+        "_icons_by_days",
         "_last_month",
         "_last_updated",
         "_manual",
@@ -48,6 +51,7 @@ class Chore(RestoreEntity):
         "_overdue",
         "_overdue_days",
         "_frequency",
+        "_schedule_start_cache",
         "_start_date",
         "_offset_dates",
         "_add_dates",
@@ -81,6 +85,14 @@ class Chore(RestoreEntity):
         self._icon_today = config.get(const.CONF_ICON_TODAY)
         self._icon_tomorrow = config.get(const.CONF_ICON_TOMORROW)
         self._icon_overdue = config.get(const.CONF_ICON_OVERDUE)
+        # Icon lookup indexed by days until due, clamped to -1..2:
+        # overdue, today, tomorrow, normal.
+        self._icons_by_days = (
+            self._icon_overdue,
+            self._icon_today,
+            self._icon_tomorrow,
+            self._icon_normal,
+        )
         self._date_format = config.get(
             const.CONF_DATE_FORMAT, const.DEFAULT_DATE_FORMAT
         )
@@ -89,6 +101,7 @@ class Chore(RestoreEntity):
             config.get(const.CONF_SHOW_OVERDUE_TODAY) or False
         )
         self._due_dates: list[date] = []
+        self._due_text_cache: tuple[list[date], list[str]] | None = None
         self._next_due_date: date | None = None
         self._last_updated: datetime | None = None
         self.last_completed: datetime | None = None
@@ -102,6 +115,7 @@ class Chore(RestoreEntity):
         self._offset_dates: str = None
         self._add_dates: str = None
         self._remove_dates: str = None
+        self._schedule_start_cache: tuple[datetime | None, date] | None = None
         try:
             self._start_date = helpers.to_date(config.get(const.CONF_START_DATE))
         except ValueError:
@@ -337,6 +351,19 @@ class Chore(RestoreEntity):
     def chore_schedule(self) -> Generator[date, None, None]:
         """Get dates within configured date range."""
         start_date: date = self._calculate_start_date()
+        # Tokenize the remove/offset strings once for the whole forecast
+        # instead of re-splitting them for every candidate date.
+        remove_dates = (
+            set(self._remove_dates.split(" "))
+            if self._remove_dates is not None
+            else ()
+        )
+        offsets: dict[str, int] = {}
+        if self._offset_dates is not None:
+            for token in self._offset_dates.split(" "):
+                offset_date, _, offset_value = token.partition(":")
+                if offset_value:
+                    offsets[offset_date] = int(offset_value)
         for _ in range(int(self._forecast_dates) + 1):
             try:
                 next_due_date = self._find_candidate_date(start_date)
@@ -347,20 +374,9 @@ class Chore(RestoreEntity):
             if (new_date := self.move_to_range(next_due_date)) != next_due_date:
                 start_date = new_date
             else:
-                should_remove = False
-                if self._remove_dates is not None:
-                    for remove_date in self._remove_dates.split(" "):
-                        if remove_date == (next_due_date.strftime("%Y-%m-%d")):
-                            should_remove = True
-                            break
-                if not should_remove:
-                    offset = None
-                    if self._offset_dates is not None:
-                        offset_compare = next_due_date.strftime("%Y-%m-%d")
-                        for offset_date in self._offset_dates.split(" "):
-                            if offset_date.startswith(offset_compare):
-                                offset = int(offset_date.split(":")[1])
-                                break
+                due_str = next_due_date.strftime("%Y-%m-%d")
+                if due_str not in remove_dates:
+                    offset = offsets.get(due_str)
                     yield (
                         next_due_date
                         if offset is None
@@ -377,8 +393,16 @@ class Chore(RestoreEntity):
     async def complete(self, last_completed: datetime) -> None:
         """Mark the chore as completed and update the state."""
         LOGGER.debug("(%s) Completing chore with last_completed: %s", self._attr_name, last_completed)
+        previous = self.last_completed
         self.last_completed = last_completed
-        await self._async_load_due_dates()
+        # Due dates are derived from the completion date only; skip the
+        # reload when just the time of day changed.
+        if (
+            not self._due_dates
+            or previous is None
+            or previous.date() != last_completed.date()
+        ):
+            await self._async_load_due_dates()
         if not self._due_dates:
             LOGGER.warning(
                 "(%s) No due dates calculated after completion. Check configuration.",
@@ -459,13 +483,15 @@ class Chore(RestoreEntity):
     def get_next_due_date(self, start_date: date, ignore_today=False) -> date | None:
         """Get next date from self._due_dates."""
         current_date_time = ha_now()  # Use timezone-aware `now`
-        LOGGER.debug(
-            "(%s) Calculating next due date: start_date=%s, ignore_today=%s, due_dates=%s",
-            self._attr_name,
-            start_date,
-            ignore_today,
-            self._due_dates,
-        )
+        debug = LOGGER.isEnabledFor(DEBUG)
+        if debug:
+            LOGGER.debug(
+                "(%s) Calculating next due date: start_date=%s, ignore_today=%s, due_dates=%s",
+                self._attr_name,
+                start_date,
+                ignore_today,
+                self._due_dates,
+            )
         for d in self._due_dates:  # pylint: disable=invalid-name
             if d < start_date:
                 continue
@@ -478,9 +504,11 @@ class Chore(RestoreEntity):
                     and current_date_time.time() >= self.last_completed.time()
                 ):
                     continue
-            LOGGER.debug("(%s) Next due date found: %s", self._attr_name, d)
+            if debug:
+                LOGGER.debug("(%s) Next due date found: %s", self._attr_name, d)
             return d
-        LOGGER.debug("(%s) No next due date found.", self._attr_name)
+        if debug:
+            LOGGER.debug("(%s) No next due date found.", self._attr_name)
         return None
 
     async def async_update(self) -> None:
@@ -496,12 +524,23 @@ class Chore(RestoreEntity):
         )
         event_data = {
             "entity_id": self.entity_id,
-            "due_dates": helpers.dates_to_texts(self._due_dates),
+            "due_dates": self._due_dates_as_texts(),
         }
         self.hass.bus.async_fire("chore_helper_loaded", event_data)
         if not self._manual:
             self.update_state()
 
+    def _due_dates_as_texts(self) -> list[str]:
+        """Return _due_dates as text, cached until the list changes."""
+        cached = self._due_text_cache
+        if cached is None or cached[0] != self._due_dates:
+            cached = (
+                self._due_dates.copy(),
+                helpers.dates_to_texts(self._due_dates),
+            )
+            self._due_text_cache = cached
+        return cached[1]
+
     def update_state(self) -> None:
         """Pick the first event from chore dates, update attributes."""
         LOGGER.debug("(%s) Looking for next chore date", self._attr_name)
@@ -509,28 +548,19 @@ class Chore(RestoreEntity):
         today = self._last_updated.date()
         self._next_due_date = self.get_next_due_date(self._calculate_start_date())
         if self._next_due_date is not None:
-            LOGGER.debug(
-                "(%s) next_due_date (%s), today (%s)",
-                self._attr_name,
-                self._next_due_date,
-                today,
-            )
-            self._days = (self._next_due_date - today).days
-            LOGGER.debug(
-                "(%s) Found next chore date: %s, that is in %d days",
-                self._attr_name,
-                self._next_due_date,
-                self._days,
-            )
+            # Ordinal subtraction gives the day count directly, without
+            # building an intermediate timedelta.
+            self._days = self._next_due_date.toordinal() - today.toordinal()
+            if LOGGER.isEnabledFor(DEBUG):
+                LOGGER.debug(
+                    "(%s) Found next chore date: %s (today %s), that is in %d days",
+                    self._attr_name,
+                    self._next_due_date,
+                    today,
+                    self._days,
+                )
             self._attr_state = self._days
-            if self._days > 1:
-                self._attr_icon = self._icon_normal
-            elif self._days < 0:
-                self._attr_icon = self._icon_overdue
-            elif self._days == 0:
-                self._attr_icon = self._icon_today
-            elif self._days == 1:
-                self._attr_icon = self._icon_tomorrow
+            self._attr_icon = self._icons_by_days[min(max(self._days, -1), 2) + 1]
             self._overdue = self._days < 0
             self._overdue_days = 0 if self._days > -1 else abs(self._days)
         else:
@@ -591,7 +621,16 @@ class Chore(RestoreEntity):
         return self.move_to_range(start_date)
 
     def _calculate_schedule_start_date(self) -> date:
-        """Calculate start date for scheduling offsets."""
+        """Calculate start date for scheduling offsets.
+
+        The result only depends on the configuration (fixed for the
+        lifetime of the entity - options changes reload it) and on
+        last_completed, so it is cached keyed on the latter. The method
+        is called once per forecast candidate.
+        """
+        cached = self._schedule_start_cache
+        if cached is not None and cached[0] == self.last_completed:
+            return cached[1]
 
         after = self._frequency[:6] == "after-"
         start_date = self._start_date
@@ -602,6 +641,7 @@ class Chore(RestoreEntity):
             if earliest_date > start_date:
                 start_date = earliest_date
 
+        self._schedule_start_cache = (self.last_completed, start_date)
         return start_date
 
     def _add_period_offset(self, start_date: date) -> date:
@@ -609,11 +649,12 @@ class Chore(RestoreEntity):
         if not hasattr(self, "_period") or self._period is None:
             raise ValueError(f"({self._attr_name}) Period is not configured.")
         next_date = start_date + timedelta(days=self._period)
-        LOGGER.debug(
-            "(%s) Adding period offset: start_date=%s, period=%d, next_date=%s",
-            self._attr_name,
-            start_date,
-            self._period,
-            next_date,
-        )
+        if LOGGER.isEnabledFor(DEBUG):
+            LOGGER.debug(
+                "(%s) Adding period offset: start_date=%s, period=%d, next_date=%s",
+                self._attr_name,
+                start_date,
+                self._period,
+                next_date,
+            )
         return next_date
\ No newline at end of file
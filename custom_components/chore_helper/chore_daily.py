@@ -1,11 +1,46 @@
+from bisect import bisect_left
+from functools import lru_cache
+from logging import DEBUG
+
 from .chore import Chore
 from .const import LOGGER
-from . import helpers
-from datetime import date, timedelta, datetime
-from dateutil.relativedelta import relativedelta
+from . import const
+from datetime import date, timedelta
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.util.dt import now as ha_now  # Import Home Assistant's timezone-aware `now`
 
+
+try:  # numpy is not a requirement but ships with many HA installs
+    import numpy as np
+except ImportError:
+    np = None
+
+# Below this many tokens the cached one-by-one parse beats numpy's
+# array construction overhead.
+_NUMPY_MIN_TOKENS = 64
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(token: str) -> date:
+    """Parse a YYYY-MM-DD token, caching results across update cycles.
+
+    The same tokens come back on every poll, so a cache hit turns the
+    parse into a dict lookup.
+    """
+    return date.fromisoformat(token)
+
+
+def _parse_token_list(raw: str) -> list[tuple[date, str]]:
+    """Parse "YYYY-MM-DD[:offset]" tokens into sorted (date, token) pairs."""
+    tokens = [x for x in raw.split(" ") if x]
+    if np is not None and len(tokens) >= _NUMPY_MIN_TOKENS:
+        # The date part of a token is always the first ten characters.
+        dates = np.array([x[:10] for x in tokens], dtype="datetime64[D]").tolist()
+    else:
+        dates = [_parse_iso(x.split(":", 1)[0]) for x in tokens]
+    return sorted(zip(dates, tokens))
+
+
 class DailyChore(Chore):
     """Entity for a daily chore."""
 
@@ -13,13 +48,36 @@ class DailyChore(Chore):
         """Read parameters specific for Daily Chore Frequency."""
         super().__init__(config_entry)
         config = config_entry.options
-        self._period = config.get('period', 1)  # Default to 1 if not provided
+        period = config.get(const.CONF_PERIOD)
+        try:
+            # Fail fast on a bad period so the hot paths can rely on a
+            # plain int without re-validating it on every call.
+            self._period: int = int(period) if period is not None else 1
+        except (TypeError, ValueError) as error:
+            raise ValueError(
+                f"({self._attr_name}) Invalid period: {period!r}"
+            ) from error
+        if self._period < 1:
+            raise ValueError(
+                f"({self._attr_name}) Period must be at least 1, got {period!r}"
+            )
+        # Parsed copies of the date token strings, kept sorted so past
+        # tokens can be dropped with a bisect instead of re-parsing and
+        # re-joining the whole string on every poll. The *_raw attributes
+        # remember which string each list was parsed from, so external
+        # changes (state restore, add/remove/offset services) are noticed.
+        self._add_dates_list: list[tuple[date, str]] | None = None
+        self._add_dates_raw: str | None = None
+        self._remove_dates_list: list[tuple[date, str]] | None = None
+        self._remove_dates_raw: str | None = None
+        self._offset_dates_list: list[tuple[date, str]] | None = None
+        self._offset_dates_raw: str | None = None
+        # Snapshot of the observable attributes as of the last state
+        # write; None so the first update always writes.
+        self._last_written_state: tuple | None = None
 
     async def async_update(self) -> None:
         """Get the latest data and updates the states."""
-        if not await self._async_ready_for_update() or not self.hass.is_running:
-            return
-
         if not self.entity_id:
             # Suppress warning if the entity is still initializing
             if not self.registry_entry:
@@ -27,20 +85,7 @@ class DailyChore(Chore):
             else:
                 LOGGER.warning("Entity ID is not assigned for %s. Skipping update.", self._attr_name)
             return
-
-        LOGGER.debug("(%s) Calling update", self._attr_name)
-        await self._async_load_due_dates()
-        LOGGER.debug(
-            "(%s) Dates loaded, firing a chore_helper_loaded event",
-            self._attr_name,
-        )
-        event_data = {
-            "entity_id": self.entity_id,
-            "due_dates": helpers.dates_to_texts(self._due_dates),
-        }
-        self.hass.bus.async_fire("chore_helper_loaded", event_data)
-        if not self._manual:
-            self.update_state()
+        await super().async_update()
 
     def update_state(self) -> None:
         """Pick the first event from chore dates, update attributes."""
@@ -51,30 +96,22 @@ class DailyChore(Chore):
         LOGGER.debug("(%s) Looking for next chore date", self._attr_name)
         self._last_updated = ha_now()  # Use timezone-aware `now`
         today = self._last_updated.date()
-        self._next_due_date = self.get_next_due_date(self._calculate_start_date())
+        start_date = self._calculate_start_date()
+        self._next_due_date = self.get_next_due_date(start_date)
         if self._next_due_date is not None:
-            LOGGER.debug(
-                "(%s) next_due_date (%s), today (%s)",
-                self._attr_name,
-                self._next_due_date,
-                today,
-            )
-            self._days = (self._next_due_date - today).days
-            LOGGER.debug(
-                "(%s) Found next chore date: %s, that is in %d days",
-                self._attr_name,
-                self._next_due_date,
-                self._days,
-            )
+            # Ordinal subtraction gives the day count directly, without
+            # building an intermediate timedelta.
+            self._days = self._next_due_date.toordinal() - today.toordinal()
+            if LOGGER.isEnabledFor(DEBUG):
+                LOGGER.debug(
+                    "(%s) Found next chore date: %s (today %s), that is in %d days",
+                    self._attr_name,
+                    self._next_due_date,
+                    today,
+                    self._days,
+                )
             self._attr_state = self._days
-            if self._days > 1:
-                self._attr_icon = self._icon_normal
-            elif self._days < 0:
-                self._attr_icon = self._icon_overdue
-            elif self._days == 0:
-                self._attr_icon = self._icon_today
-            elif self._days == 1:
-                self._attr_icon = self._icon_tomorrow
+            self._attr_icon = self._icons_by_days[min(max(self._days, -1), 2) + 1]
             self._overdue = self._days < 0
             self._overdue_days = 0 if self._days > -1 else abs(self._days)
         else:
@@ -84,74 +121,92 @@ class DailyChore(Chore):
             self._overdue = False
             self._overdue_days = None
 
-        start_date = self._calculate_start_date()
-        if self._add_dates is not None:
-            self._add_dates = " ".join(
-                [
-                    x
-                    for x in self._add_dates.split(" ")
-                    if datetime.strptime(x, "%Y-%m-%d").date() >= start_date
-                ]
-            )
-        if self._remove_dates is not None:
-            self._remove_dates = " ".join(
-                [
-                    x
-                    for x in self._remove_dates.split(" ")
-                    if datetime.strptime(x, "%Y-%m-%d").date() >= start_date
-                ]
-            )
-        if self._offset_dates is not None:
-            self._offset_dates = " ".join(
-                [
-                    x
-                    for x in self._offset_dates.split(" ")
-                    if datetime.strptime(x.split(":")[0], "%Y-%m-%d").date()
-                    >= start_date
-                ]
-            )
-        self.async_write_ha_state()
+        self._drop_past_tokens("_add_dates", start_date)
+        self._drop_past_tokens("_remove_dates", start_date)
+        self._drop_past_tokens("_offset_dates", start_date)
+        # Compare against the snapshot persisted at the last write, not
+        # one taken on entry: callers such as complete() and the
+        # add/remove/offset services mutate the inputs before calling
+        # update_state, so an entry snapshot would already contain them.
+        observable_state = self._observable_state()
+        if observable_state != self._last_written_state:
+            self._last_written_state = observable_state
+            self.async_write_ha_state()
+
+    def _drop_past_tokens(self, attr: str, start_date: date) -> None:
+        """Drop tokens dated before start_date from a date token attribute.
+
+        Shared by _add_dates, _remove_dates and _offset_dates, together
+        with the parsed-list caches set up in __init__. Tokens are kept
+        sorted, so the common nothing-expired case is a single date
+        comparison and the rest is a bisect plus slice.
+        """
+        raw = getattr(self, attr)
+        if raw is None:
+            return
+        tokens = getattr(self, attr + "_list")
+        if tokens is None or raw != getattr(self, attr + "_raw"):
+            tokens = _parse_token_list(raw)
+            setattr(self, attr + "_list", tokens)
+        if tokens and tokens[0][0] < start_date:
+            cut = bisect_left(tokens, start_date, key=lambda item: item[0])
+            del tokens[:cut]
+            raw = " ".join(token for _, token in tokens)
+            setattr(self, attr, raw)
+        setattr(self, attr + "_raw", raw)
+
+    def _observable_state(self) -> tuple:
+        """Return the attributes worth a state write when they change.
+
+        last_updated is deliberately left out - it changes on every
+        update and would defeat the comparison.
+        """
+        return (
+            self._attr_state,
+            self._attr_icon,
+            self._next_due_date,
+            self._overdue,
+            self._overdue_days,
+            self.last_completed,
+            self._add_dates,
+            self._remove_dates,
+            self._offset_dates,
+        )
 
     def _find_candidate_date(self, day1: date) -> date | None:
         """Calculate possible date, for every-n-days and after-n-days frequency."""
+        period = self._period
+        name = self._attr_name
         schedule_start_date = self._calculate_schedule_start_date()
         day1 = self.calculate_day1(day1, schedule_start_date)
 
-        if schedule_start_date is None or self._period is None:
+        if schedule_start_date is None:
             LOGGER.error(
-                "(%s) Missing schedule_start_date or period configuration.",
-                self._attr_name,
+                "(%s) Missing schedule_start_date configuration.",
+                name,
             )
             return None
 
         try:
-            remainder = (day1 - schedule_start_date).days % self._period
-            if remainder == 0:
-                return day1
-            offset = self._period - remainder
+            # Negating before the modulo yields the days until the next
+            # aligned date directly (0 when day1 is already aligned),
+            # instead of computing a remainder and branching on it.
+            offset = -(day1 - schedule_start_date).days % period
         except TypeError as error:
             raise ValueError(
-                f"({self._attr_name}) Please configure start_date and period "
+                f"({name}) Please configure start_date and period "
                 "for every-n-days or after-n-days chore frequency."
             ) from error
+        if offset == 0:
+            return day1
 
-        candidate_date = day1 + relativedelta(days=offset)
-        LOGGER.debug(
-            "(%s) Calculated candidate date: day1=%s, schedule_start_date=%s, candidate_date=%s",
-            self._attr_name,
-            day1,
-            schedule_start_date,
-            candidate_date,
-        )
-        return candidate_date
-
-    async def complete(self, last_completed: datetime) -> None:
-        """Mark the chore as completed and update the state."""
-        self.last_completed = last_completed
-        await self._async_load_due_dates()
-        if not self._due_dates:
-            LOGGER.warning(
-                "(%s) No due dates calculated after completion. Check configuration.",
-                self._attr_name,
+        candidate_date = day1 + timedelta(days=offset)
+        if LOGGER.isEnabledFor(DEBUG):
+            LOGGER.debug(
+                "(%s) Calculated candidate date: day1=%s, schedule_start_date=%s, candidate_date=%s",
+                name,
+                day1,
+                schedule_start_date,
+                candidate_date,
             )
-        self.update_state()
+        return candidate_date
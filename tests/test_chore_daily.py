@@ -0,0 +1,40 @@
+"""Tests for the daily chore entity."""
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.chore_helper.chore_daily import DailyChore
+
+
+def _make_chore() -> DailyChore:
+    """Build a daily chore without going through the config flow."""
+    config_entry = MagicMock()
+    config_entry.title = "Test chore"
+    config_entry.options = {
+        "frequency": "every-n-days",
+        "period": 1,
+        "start_date": "2024-01-01",
+    }
+    chore = DailyChore(config_entry)
+    chore.entity_id = "sensor.test_chore"
+    return chore
+
+
+async def test_same_day_repeat_completion_is_published(hass):
+    """A second completion on the same day must still write the state."""
+    chore = _make_chore()
+    chore.hass = hass
+    with patch.object(DailyChore, "async_write_ha_state") as write_state:
+        first = dt_util.now().replace(hour=8, minute=0, second=0, microsecond=0)
+        await chore.complete(first)
+        assert chore.last_completed == first
+        assert write_state.call_count == 1
+
+        # The due dates are unchanged (their reload is skipped for a
+        # same-day repeat), but the new completion time still has to
+        # reach the state machine.
+        second = first + timedelta(hours=2)
+        await chore.complete(second)
+        assert chore.last_completed == second
+        assert write_state.call_count == 2